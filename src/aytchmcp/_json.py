@@ -0,0 +1,57 @@
+"""
+JSON helpers for AytchMCP.
+
+This module uses orjson when it is installed and falls back to the
+standard library json module otherwise.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize JSON data.
+
+    Args:
+        data: The JSON document as bytes or str.
+
+    Returns:
+        The deserialized Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to JSON.
+
+    Args:
+        obj: The object to serialize.
+        indent: Whether to pretty-print with an indent of two spaces.
+        sort_keys: Whether to sort dictionary keys.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
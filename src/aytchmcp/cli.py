@@ -5,15 +5,13 @@ This module provides a command-line interface for the AytchMCP server.
 """
 
 import argparse
-import asyncio
 import os
 import sys
 from pathlib import Path
 
 from loguru import logger
 
-from aytchmcp.config import load_config
-from aytchmcp.server import AytchMCPServer
+from aytchmcp._json import dumps
 
 
 def parse_args():
@@ -42,6 +40,9 @@ def parse_args():
     start_parser.add_argument(
         "--debug", action="store_true", help="Enable debug mode"
     )
+    start_parser.add_argument(
+        "--workers", type=int, help="Number of worker processes"
+    )
     
     # Init command
     init_parser = subparsers.add_parser(
@@ -103,15 +104,13 @@ def init_config(config_dir: str):
             "debug": False,
             "cors_origins": ["*"],
             "max_request_size": 10485760,
+            "workers": 1,
         },
     }
     
-    import json
-    
     for filename, content in config_files.items():
         file_path = config_dir / filename
-        with open(file_path, "w") as f:
-            json.dump(content, f, indent=2)
+        file_path.write_bytes(dumps(content, indent=True))
         
         logger.info(f"Created configuration file: {file_path}")
     
@@ -147,7 +146,7 @@ def show_version():
     print(f"AytchMCP version: {__version__}")
 
 
-async def start_server(args):
+def start_server(args):
     """Start the MCP server."""
     # Set environment variables from command-line arguments
     if args.host:
@@ -158,22 +157,36 @@ async def start_server(args):
         os.environ["LOG_LEVEL"] = args.log_level
     if args.debug:
         os.environ["DEBUG"] = "true"
-    
-    # Load configuration
+    if args.workers:
+        os.environ["MCP_WORKERS"] = str(args.workers)
     if args.config:
-        config = load_config(args.config)
+        os.environ["CONFIG_PATH"] = args.config
     
     # Start server
-    server = AytchMCPServer()
-    await server.start()
+    from aytchmcp.server import serve
+    
+    serve()
+
+
+# Commands without arguments that can run without building the parser
+_FAST_COMMANDS = {
+    "version": show_version,
+    "list-tools": list_tools,
+    "list-resources": list_resources,
+}
 
 
 def main():
     """Run the CLI."""
+    # Short-circuit simple commands before building the argument parser
+    if len(sys.argv) == 2 and sys.argv[1] in _FAST_COMMANDS:
+        _FAST_COMMANDS[sys.argv[1]]()
+        return
+    
     args = parse_args()
     
     if args.command == "start":
-        asyncio.run(start_server(args))
+        start_server(args)
     elif args.command == "init":
         init_config(args.dir)
     elif args.command == "list-resources":
@@ -8,20 +8,19 @@ This module handles loading configuration from various sources:
 """
 
 import os
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
-
-# Load environment variables from .env file if it exists
-load_dotenv()
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
 
 class BrandingConfig(BaseModel):
     """Branding configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(default="Aytch4K MCP", description="Name of the MCP server")
     description: str = Field(
         default="Aytch4K Model Context Protocol Server",
@@ -41,6 +40,8 @@ class BrandingConfig(BaseModel):
 class LLMConfig(BaseModel):
     """LLM integration configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     provider: str = Field(
         default="openai",
         description="LLM provider (openai, anthropic, openrouter, ninjachat, etc.)"
@@ -71,11 +72,48 @@ class LLMConfig(BaseModel):
         default="NINJACHAT_MODEL",
         description="Environment variable name for the NinjaChat model",
     )
+    # Response cache configuration (used by get_llm_response(cache=True))
+    cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached LLM response is served as fresh",
+    )
+    cache_max_stale: float = Field(
+        default=86400.0,
+        description="Seconds a stale cached LLM response is still served while it is refreshed",
+    )
+
+    # Values read from the environment variables above, resolved at load time
+    _api_key: Optional[str] = PrivateAttr(default=None)
+    _openrouter_model: Optional[str] = PrivateAttr(default=None)
+    _ninjachat_model: Optional[str] = PrivateAttr(default=None)
+
+    def resolve_env(self) -> None:
+        """Read the API key and model environment variables into memory."""
+        self._api_key = os.environ.get(self.api_key_env_var)
+        self._openrouter_model = os.environ.get(self.openrouter_model_env_var)
+        self._ninjachat_model = os.environ.get(self.ninjachat_model_env_var)
+
+    @property
+    def api_key(self) -> Optional[str]:
+        """API key read from `api_key_env_var`."""
+        return self._api_key
+
+    @property
+    def openrouter_model(self) -> Optional[str]:
+        """OpenRouter model read from `openrouter_model_env_var`."""
+        return self._openrouter_model
+
+    @property
+    def ninjachat_model(self) -> Optional[str]:
+        """NinjaChat model read from `ninjachat_model_env_var`."""
+        return self._ninjachat_model
 
 
 class ServerConfig(BaseModel):
     """Server configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     host: str = Field(
         default="0.0.0.0", description="Host to bind the server to"
     )
@@ -90,11 +128,16 @@ class ServerConfig(BaseModel):
     max_request_size: int = Field(
         default=10 * 1024 * 1024, description="Maximum request size in bytes"
     )
+    workers: int = Field(
+        default=1, description="Number of worker processes (ignored in debug mode)"
+    )
 
 
 class MCPConfig(BaseModel):
     """MCP configuration."""
 
+    model_config = ConfigDict(defer_build=True)
+
     branding: BrandingConfig = Field(default_factory=BrandingConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
     server: ServerConfig = Field(default_factory=ServerConfig)
@@ -108,75 +151,152 @@ class MCPConfig(BaseModel):
     )
 
 
-def load_config(config_path: Optional[Union[str, Path]] = None) -> MCPConfig:
+# Environment variable overrides as (variable, config section, field, converter)
+_ENV_OVERRIDES: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ("MCP_HOST", "server", "host", str),
+    ("MCP_PORT", "server", "port", int),
+    ("LOG_LEVEL", "server", "log_level", str),
+    ("MCP_WORKERS", "server", "workers", int),
+    ("DEBUG", "server", "debug", lambda value: value.lower() in ("true", "1", "yes")),
+)
+
+
+@lru_cache(maxsize=None)
+def _get_adapter(model: type) -> TypeAdapter:
     """
-    Load configuration from various sources.
+    Get the shared TypeAdapter for a configuration model.
+
+    Adapters are built on first use and reused for every later load.
+
+    Args:
+        model: The configuration model class.
+
+    Returns:
+        The TypeAdapter for the model.
+    """
+    return TypeAdapter(model)
+
+
+def _load_config_files(config_path: Path) -> MCPConfig:
+    """
+    Load configuration from a configuration directory or file.
 
     Args:
         config_path: Path to the configuration directory or file.
-            If a directory, it will look for config.json, branding.json, llm.json.
-            If a file, it will load that specific file.
-            If None, it will use the CONFIG_PATH environment variable or default to ./config.
 
     Returns:
-        MCPConfig: The loaded configuration.
+        MCPConfig: The configuration defined by the files.
     """
     # Default configuration
     config = MCPConfig()
 
-    # Determine config path
-    if config_path is None:
-        config_path = os.environ.get("CONFIG_PATH", "./config")
-    
-    config_path = Path(config_path)
-
-    # Load from config files
     if config_path.is_dir():
         # Load main config if it exists
         main_config_path = config_path / "config.json"
         if main_config_path.exists():
-            with open(main_config_path, "r") as f:
-                config_dict = json.load(f)
-                config = MCPConfig.model_validate(config_dict)
+            config = _get_adapter(MCPConfig).validate_json(
+                main_config_path.read_bytes()
+            )
 
         # Load branding config if it exists
         branding_config_path = config_path / "branding.json"
         if branding_config_path.exists():
-            with open(branding_config_path, "r") as f:
-                branding_dict = json.load(f)
-                config.branding = BrandingConfig.model_validate(branding_dict)
+            config.branding = _get_adapter(BrandingConfig).validate_json(
+                branding_config_path.read_bytes()
+            )
 
         # Load LLM config if it exists
         llm_config_path = config_path / "llm.json"
         if llm_config_path.exists():
-            with open(llm_config_path, "r") as f:
-                llm_dict = json.load(f)
-                config.llm = LLMConfig.model_validate(llm_dict)
+            config.llm = _get_adapter(LLMConfig).validate_json(
+                llm_config_path.read_bytes()
+            )
 
         # Load server config if it exists
         server_config_path = config_path / "server.json"
         if server_config_path.exists():
-            with open(server_config_path, "r") as f:
-                server_dict = json.load(f)
-                config.server = ServerConfig.model_validate(server_dict)
+            config.server = _get_adapter(ServerConfig).validate_json(
+                server_config_path.read_bytes()
+            )
     elif config_path.is_file():
         # Load from a single config file
-        with open(config_path, "r") as f:
-            config_dict = json.load(f)
-            config = MCPConfig.model_validate(config_dict)
+        config = _get_adapter(MCPConfig).validate_json(
+            config_path.read_bytes()
+        )
+
+    return config
+
+
+def load_config(config_path: Optional[Union[str, Path]] = None) -> MCPConfig:
+    """
+    Load configuration from various sources.
+
+    Args:
+        config_path: Path to the configuration directory or file.
+            If a directory, it will look for config.json, branding.json, llm.json,
+            and load environment variables from a .env file if present.
+            If a file, it will load that specific file.
+            If None, it will use the CONFIG_PATH environment variable or default to ./config.
+
+    Returns:
+        MCPConfig: The loaded configuration.
+    """
+    # Determine config path
+    if config_path is None:
+        config_path = os.environ.get("CONFIG_PATH", "./config")
+    
+    config_path = Path(config_path)
+
+    # Load environment variables from a .env file in the config directory
+    dotenv_path = config_path / ".env"
+    if config_path.is_dir() and dotenv_path.is_file():
+        load_dotenv(dotenv_path=dotenv_path, override=False)
+
+    # Load from config files
+    config = _load_config_files(config_path)
 
     # Override with environment variables
-    if "MCP_HOST" in os.environ:
-        config.server.host = os.environ["MCP_HOST"]
-    if "MCP_PORT" in os.environ:
-        config.server.port = int(os.environ["MCP_PORT"])
-    if "LOG_LEVEL" in os.environ:
-        config.server.log_level = os.environ["LOG_LEVEL"]
-    if "DEBUG" in os.environ:
-        config.server.debug = os.environ["DEBUG"].lower() in ("true", "1", "yes")
+    env = os.environ
+    for env_var, section, field, cast in _ENV_OVERRIDES:
+        value = env.get(env_var)
+        if value is not None:
+            setattr(getattr(config, section), field, cast(value))
+
+    # Resolve environment-backed LLM settings once
+    config.llm.resolve_env()
 
     return config
 
 
-# Global configuration instance
-config = load_config()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> MCPConfig:
+    """
+    Get the global configuration, loading it on first use.
+
+    Environment variables from a .env file, if one exists, are loaded first.
+
+    Returns:
+        MCPConfig: The global configuration.
+    """
+    load_dotenv()
+    return load_config()
+
+
+def reload_config() -> MCPConfig:
+    """
+    Reload the global configuration.
+
+    Configuration files and environment variables are read again.
+
+    Returns:
+        MCPConfig: The reloaded global configuration.
+    """
+    get_config.cache_clear()
+    return get_config()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the global `config` lazily so importing this module stays cheap."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
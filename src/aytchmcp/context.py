@@ -5,18 +5,137 @@ This module provides the Context object that gives tools and resources
 access to MCP capabilities.
 """
 
-from typing import Any, Dict, Optional, TypeVar, Generic, List, Union
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar, Generic, List, Union
+import asyncio
+import hashlib
+import importlib.util
+import sys
+import time
 import uuid
 
 from loguru import logger
 from pydantic import BaseModel
 
-from aytchmcp.config import config
+from aytchmcp._json import dumps, loads
+from aytchmcp.config import get_config
+from aytchmcp.http_client import get_async_client
 
 
 T = TypeVar("T")
 
 
+def _lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Import a module lazily.
+    
+    The module is registered in sys.modules immediately, but its code only
+    runs on first attribute access.
+    
+    Args:
+        name: The module name.
+        
+    Returns:
+        The module, or None if it is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    
+    return module
+
+
+# LLM provider SDKs, loaded on first use
+openai = _lazy_import("openai")
+anthropic = _lazy_import("anthropic")
+
+# Serialized configuration, cached for the configuration instance it was built from
+_config_dump: Optional[Tuple[Any, Dict[str, Any]]] = None
+
+# Static headers for JSON requests to HTTP-based LLM providers
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_OPENROUTER_HEADERS = {
+    **_JSON_HEADERS,
+    "HTTP-Referer": "https://aytch4k.com",  # Replace with your site URL
+}
+
+# Maximum number of cached LLM responses
+_LLM_CACHE_MAX_ENTRIES = 1024
+
+# Cached LLM responses keyed by request digest, as (monotonic timestamp, response)
+_llm_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
+# Background refreshes of stale LLM responses, keyed by request digest
+_llm_refreshing: Dict[bytes, "asyncio.Task[None]"] = {}
+
+
+def _llm_cache_key(
+    provider: str,
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    params: Dict[str, Any],
+) -> Optional[bytes]:
+    """
+    Build the cache key for an LLM request.
+    
+    Args:
+        provider: The LLM provider.
+        prompt: The prompt sent to the LLM.
+        model: The model used.
+        temperature: The temperature used for generation.
+        max_tokens: The maximum number of tokens to generate.
+        params: Additional parameters passed to the LLM.
+        
+    Returns:
+        The request digest, or None if the parameters cannot be serialized.
+    """
+    try:
+        request = dumps(
+            {
+                "provider": provider,
+                "prompt": prompt,
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "params": params,
+            },
+            sort_keys=True,
+        )
+    except TypeError:
+        return None
+    
+    return hashlib.blake2b(request, digest_size=16).digest()
+
+
+def _store_llm_response(key: bytes, response: str) -> None:
+    """Cache an LLM response, skipping error responses."""
+    if response.startswith("Error"):
+        return
+    
+    _llm_cache[key] = (time.monotonic(), response)
+    _llm_cache.move_to_end(key)
+    
+    if len(_llm_cache) > _LLM_CACHE_MAX_ENTRIES:
+        _llm_cache.popitem(last=False)
+
+
+async def _refresh_llm_response(key: bytes, response: Awaitable[str]) -> None:
+    """Refresh a stale cached LLM response in the background."""
+    _store_llm_response(key, await response)
+
+
 class Context:
     """
     Context object for AytchMCP tools and resources.
@@ -25,6 +144,11 @@ class Context:
     functionality specific to AytchMCP.
     """
 
+    __slots__ = ("_user_id", "_conversation_id", "_request_id", "_cache")
+
+    # Maximum number of entries kept in the per-context cache
+    _MAX_CACHE_SIZE = 256
+
     def __init__(self, user_id: Optional[str] = None, conversation_id: Optional[str] = None, request_id: Optional[str] = None):
         """
         Initialize the Context object.
@@ -34,24 +158,31 @@ class Context:
             conversation_id: The conversation ID.
             request_id: The request ID.
         """
-        self._user_id = user_id or str(uuid.uuid4())
-        self._conversation_id = conversation_id or str(uuid.uuid4())
-        self._request_id = request_id or str(uuid.uuid4())
-        self._cache: Dict[str, Any] = {}
+        # Missing IDs are generated on first access
+        self._user_id = user_id or None
+        self._conversation_id = conversation_id or None
+        self._request_id = request_id or None
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
 
     @property
     def user_id(self) -> str:
         """Get the user ID."""
+        if self._user_id is None:
+            self._user_id = str(uuid.uuid4())
         return self._user_id
 
     @property
     def conversation_id(self) -> str:
         """Get the conversation ID."""
+        if self._conversation_id is None:
+            self._conversation_id = str(uuid.uuid4())
         return self._conversation_id
 
     @property
     def request_id(self) -> str:
         """Get the request ID."""
+        if self._request_id is None:
+            self._request_id = str(uuid.uuid4())
         return self._request_id
 
     async def get_llm_response(
@@ -60,28 +191,37 @@ class Context:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        cache: bool = False,
         **kwargs
     ) -> str:
         """
         Get a response from the LLM.
         
+        With cache enabled, identical requests are answered from a shared
+        response cache. Responses younger than `llm.cache_ttl` are returned
+        directly; older ones are returned while a background request
+        refreshes them, until they exceed `llm.cache_max_stale`. Only use
+        the cache for deterministic prompts (e.g. temperature 0).
+        
         Args:
             prompt: The prompt to send to the LLM.
             model: The model to use. If None, uses the configured model.
             temperature: The temperature to use for generation.
             max_tokens: The maximum number of tokens to generate.
+            cache: Whether to serve the response from the response cache.
             **kwargs: Additional parameters to pass to the LLM.
             
         Returns:
             The LLM response.
         """
+        config = get_config()
+
         # Use the configured LLM provider
         provider = config.llm.provider
         model = model or config.llm.model
         
-        # Get the API key from the environment variable
-        import os
-        api_key = os.environ.get(config.llm.api_key_env_var)
+        # Get the API key resolved from the environment variable
+        api_key = config.llm.api_key
         
         if not api_key:
             logger.warning(f"API key not found in environment variable {config.llm.api_key_env_var}")
@@ -91,17 +231,43 @@ class Context:
         params = {**config.llm.additional_params, **kwargs}
         
         # Call the appropriate LLM provider
-        if provider == "openai":
-            return await self._call_openai(prompt, model, api_key, temperature, max_tokens, params)
-        elif provider == "anthropic":
-            return await self._call_anthropic(prompt, model, api_key, temperature, max_tokens, params)
-        elif provider == "openrouter":
-            return await self._call_openrouter(prompt, model, api_key, temperature, max_tokens, params)
-        elif provider == "ninjachat":
-            return await self._call_ninjachat(prompt, model, api_key, temperature, max_tokens, params)
-        else:
+        handler = self._PROVIDERS.get(provider)
+        if handler is None:
             logger.error(f"Unsupported LLM provider: {provider}")
             return f"Error: Unsupported LLM provider: {provider}"
+        
+        key = None
+        if cache:
+            key = _llm_cache_key(provider, prompt, model, temperature, max_tokens, params)
+        
+        if key is None:
+            return await handler(self, prompt, model, api_key, temperature, max_tokens, params)
+        
+        # Serve from the cache, refreshing stale responses in the background
+        cached = _llm_cache.get(key)
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < config.llm.cache_ttl:
+                _llm_cache.move_to_end(key)
+                return cached[1]
+            if age < config.llm.cache_max_stale:
+                if key not in _llm_refreshing:
+                    task = asyncio.create_task(
+                        _refresh_llm_response(
+                            key,
+                            handler(self, prompt, model, api_key, temperature, max_tokens, params),
+                        )
+                    )
+                    # An eagerly started refresh may have finished already
+                    if not task.done():
+                        _llm_refreshing[key] = task
+                        task.add_done_callback(lambda _task: _llm_refreshing.pop(key, None))
+                return cached[1]
+        
+        response = await handler(self, prompt, model, api_key, temperature, max_tokens, params)
+        _store_llm_response(key, response)
+        
+        return response
 
     async def _call_openai(
         self, 
@@ -114,8 +280,10 @@ class Context:
     ) -> str:
         """Call the OpenAI API."""
         try:
-            import openai
+            if openai is None:
+                raise ImportError("openai not installed. Install with 'pip install openai'")
             
+            config = get_config()
             openai.api_key = api_key
             if config.llm.api_base_url:
                 openai.api_base = config.llm.api_base_url
@@ -144,8 +312,10 @@ class Context:
     ) -> str:
         """Call the Anthropic API."""
         try:
-            import anthropic
+            if anthropic is None:
+                raise ImportError("anthropic not installed. Install with 'pip install anthropic'")
             
+            config = get_config()
             client = anthropic.Anthropic(api_key=api_key)
             if config.llm.api_base_url:
                 # Set custom API base URL if provided
@@ -175,13 +345,11 @@ class Context:
     ) -> str:
         """Call the OpenRouter API."""
         try:
-            import os
-            import httpx
+            config = get_config()
             
             # Get the model from environment variable if not specified
             if model == "openrouter":
-                env_var = config.llm.openrouter_model_env_var
-                model = os.environ.get(env_var, "openai/gpt-4-turbo")
+                model = config.llm.openrouter_model or "openai/gpt-4-turbo"
             
             # Prepare the API URL
             api_url = config.llm.api_base_url or "https://openrouter.ai/api/v1/chat/completions"
@@ -197,24 +365,23 @@ class Context:
             
             # Prepare headers
             headers = {
+                **_OPENROUTER_HEADERS,
                 "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://aytch4k.com",  # Replace with your site URL
                 "X-Title": config.branding.name
             }
             
-            # Make the API call
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    api_url,
-                    json=payload,
-                    headers=headers
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                return result["choices"][0]["message"]["content"]
+            # Make the API call using the shared client
+            client = get_async_client()
+            response = await client.post(
+                api_url,
+                content=dumps(payload),
+                headers=headers
+            )
+            
+            response.raise_for_status()
+            result = loads(response.content)
+            
+            return result["choices"][0]["message"]["content"]
         except Exception as e:
             logger.error(f"Error calling OpenRouter API: {e}")
             return f"Error calling OpenRouter API: {str(e)}"
@@ -230,13 +397,11 @@ class Context:
     ) -> str:
         """Call the NinjaChat API."""
         try:
-            import os
-            import httpx
+            config = get_config()
             
             # Get the model from environment variable if not specified
             if model == "ninjachat":
-                env_var = config.llm.ninjachat_model_env_var
-                model = os.environ.get(env_var, "default-model")
+                model = config.llm.ninjachat_model or "default-model"
             
             # Prepare the API URL
             api_url = config.llm.api_base_url or "https://api.ninjachat.ai/api/chat"
@@ -252,28 +417,36 @@ class Context:
             
             # Prepare headers
             headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
+                **_JSON_HEADERS,
+                "Authorization": f"Bearer {api_key}"
             }
             
-            # Make the API call
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    api_url,
-                    json=payload,
-                    headers=headers
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Extract the response content based on NinjaChat's API response format
-                # Adjust this based on the actual response structure
-                return result["choices"][0]["message"]["content"]
+            # Make the API call using the shared client
+            client = get_async_client()
+            response = await client.post(
+                api_url,
+                content=dumps(payload),
+                headers=headers
+            )
+            
+            response.raise_for_status()
+            result = loads(response.content)
+            
+            # Extract the response content based on NinjaChat's API response format
+            # Adjust this based on the actual response structure
+            return result["choices"][0]["message"]["content"]
         except Exception as e:
             logger.error(f"Error calling NinjaChat API: {e}")
             return f"Error calling NinjaChat API: {str(e)}"
 
+    # LLM provider dispatch table
+    _PROVIDERS: Dict[str, Callable[..., Awaitable[str]]] = {
+        "openai": _call_openai,
+        "anthropic": _call_anthropic,
+        "openrouter": _call_openrouter,
+        "ninjachat": _call_ninjachat,
+    }
+
     def cache_get(self, key: str, default: Optional[T] = None) -> Optional[T]:
         """
         Get a value from the cache.
@@ -285,17 +458,30 @@ class Context:
         Returns:
             The cached value, or the default if not found.
         """
-        return self._cache.get(key, default)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            return default
+        
+        self._cache.move_to_end(key)
+        return value
 
     def cache_set(self, key: str, value: Any) -> None:
         """
         Set a value in the cache.
         
+        The least recently used entry is evicted once the cache holds more
+        than _MAX_CACHE_SIZE entries.
+        
         Args:
             key: The cache key.
             value: The value to cache.
         """
         self._cache[key] = value
+        self._cache.move_to_end(key)
+        
+        if len(self._cache) > self._MAX_CACHE_SIZE:
+            self._cache.popitem(last=False)
 
     def cache_delete(self, key: str) -> None:
         """
@@ -322,7 +508,17 @@ class Context:
         """
         Get the current configuration.
         
+        The configuration is serialized once per load and reused. The
+        returned dictionary is a shallow copy, so nested values are shared
+        and should not be modified.
+        
         Returns:
             The current configuration as a dictionary.
         """
-        return config.model_dump()
\ No newline at end of file
+        global _config_dump
+        
+        config = get_config()
+        if _config_dump is None or _config_dump[0] is not config:
+            _config_dump = (config, config.model_dump())
+        
+        return _config_dump[1].copy()
\ No newline at end of file
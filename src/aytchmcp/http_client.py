@@ -0,0 +1,64 @@
+"""
+HTTP client module for AytchMCP.
+
+This module provides shared HTTP clients so outgoing requests reuse
+pooled connections instead of opening a new connection for every call.
+"""
+
+from typing import Optional
+
+import httpx
+
+
+# Connection pool limits for the shared asynchronous client
+_ASYNC_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Shared clients, created on first use
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.Client:
+    """
+    Get the shared synchronous HTTP client.
+
+    The client follows redirects and keeps connections alive between
+    requests.
+
+    Returns:
+        The shared httpx.Client instance.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.Client(follow_redirects=True, timeout=30.0)
+
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared asynchronous HTTP client.
+
+    Returns:
+        The shared httpx.AsyncClient instance.
+    """
+    global _async_client
+
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(limits=_ASYNC_LIMITS)
+
+    return _async_client
+
+
+async def aclose_clients() -> None:
+    """Close the shared HTTP clients."""
+    global _client, _async_client
+
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+    if _client is not None:
+        _client.close()
+        _client = None
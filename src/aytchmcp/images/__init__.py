@@ -4,22 +4,50 @@ Images module for AytchMCP.
 This module provides functionality for handling image data.
 """
 
-import base64
 import io
+import mmap
 import os
+import re
+import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Union, List, Dict, Any
 
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from aytchmcp.http_client import get_async_client, get_client
 
-class Image(BaseModel):
-    """
-    Image class for handling image data.
-    
-    This class provides functionality for working with images in various formats.
-    """
+# Use the SIMD-accelerated pybase64 codec when it is installed
+try:
+    import pybase64 as _b64
+
+    _b64encode_as_string = _b64.b64encode_as_string
+except ImportError:
+    import base64 as _b64
+
+    def _b64encode_as_string(data: bytes) -> str:
+        """Base64-encode data and return the result as a string."""
+        return _b64.b64encode(data).decode("ascii")
+
+
+# PIL is optional; it is only needed for decoding and transforming images
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
+
+# Chunk size used when streaming image data to disk
+_CHUNK_SIZE = 64 * 1024
+
+# Data URL prefix ("data:<mime type>[;<parameters>],")
+_DATA_URL_RE = re.compile(r"data:([^;,]*)[^,]*,")
+_DATA_URL_BYTES_RE = re.compile(rb"data:([^;,]*)[^,]*,")
+
+
+class ImageSchema(BaseModel):
+    """Image model used where validation or a schema is needed, such as API boundaries."""
     
     content: Optional[bytes] = Field(
         default=None,
@@ -45,11 +73,74 @@ class Image(BaseModel):
         default_factory=dict,
         description="Additional metadata for the image",
     )
+
+
+@dataclass
+class Image:
+    """
+    Image class for handling image data.
+    
+    This class provides functionality for working with images in various formats.
+    It is a plain dataclass so creating many images stays cheap; use
+    ImageSchema where validation or a JSON schema is needed.
+    """
+    
+    # Raw image content as bytes
+    content: Optional[bytes] = None
+    # Base64-encoded image content, as a str or ASCII bytes
+    base64_content: Optional[Union[str, bytes]] = None
+    # URL to the image
+    url: Optional[str] = None
+    # Path to the image file
+    path: Optional[str] = None
+    # MIME type of the image
+    mime_type: Optional[str] = None
+    # Additional metadata for the image
+    metadata: Dict[str, Any] = field(default_factory=dict)
     
-    class Config:
-        """Pydantic model configuration."""
+    # Decoded PIL image, kept so chained transforms are only encoded once
+    _pil: Any = field(default=None, init=False, repr=False, compare=False)
+    _pil_format: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Bytes and base64 derived from the image source, cached after first use
+    _bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _base64: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_schema(cls, schema: ImageSchema) -> "Image":
+        """
+        Create an Image from a validated ImageSchema.
         
-        arbitrary_types_allowed = True
+        Args:
+            schema: The image schema.
+            
+        Returns:
+            An Image instance.
+        """
+        return cls(
+            content=schema.content,
+            base64_content=schema.base64_content,
+            url=schema.url,
+            path=schema.path,
+            mime_type=schema.mime_type,
+            metadata=dict(schema.metadata),
+        )
+    
+    def to_schema(self) -> ImageSchema:
+        """
+        Get the image as an ImageSchema.
+        
+        Returns:
+            The image schema.
+        """
+        return ImageSchema(
+            content=self.content,
+            base64_content=self.to_base64() if self.base64_content is not None else None,
+            url=self.url,
+            path=self.path,
+            mime_type=self.mime_type,
+            metadata=dict(self.metadata),
+        )
     
     @classmethod
     def from_bytes(cls, content: bytes, mime_type: Optional[str] = None, **kwargs) -> "Image":
@@ -71,26 +162,38 @@ class Image(BaseModel):
         )
     
     @classmethod
-    def from_base64(cls, base64_content: str, mime_type: Optional[str] = None, **kwargs) -> "Image":
+    def from_base64(
+        cls, base64_content: Union[str, bytes], mime_type: Optional[str] = None, **kwargs
+    ) -> "Image":
         """
         Create an Image from base64-encoded content.
         
+        ASCII strings are stored as bytes, which the base64 decoder reads
+        without converting them first.
+        
         Args:
-            base64_content: The base64-encoded image content.
+            base64_content: The base64-encoded image content, optionally as a data URL.
             mime_type: The MIME type of the image.
             **kwargs: Additional metadata.
             
         Returns:
             An Image instance.
         """
-        # Remove data URL prefix if present
-        if base64_content.startswith("data:"):
-            # Extract MIME type from data URL
-            if mime_type is None and ";" in base64_content:
-                mime_type = base64_content.split(";")[0].split(":")[1]
+        if isinstance(base64_content, str) and base64_content.isascii():
+            base64_content = base64_content.encode("ascii")
+        
+        # Remove data URL prefix if present, extracting the MIME type
+        if isinstance(base64_content, bytes):
+            match = _DATA_URL_BYTES_RE.match(base64_content)
+        else:
+            match = _DATA_URL_RE.match(base64_content)
+        if match:
+            if mime_type is None and match.group(1):
+                mime_type = match.group(1)
+                if isinstance(mime_type, bytes):
+                    mime_type = mime_type.decode("ascii")
             
-            # Remove prefix
-            base64_content = base64_content.split(",", 1)[1]
+            base64_content = base64_content[match.end():]
         
         return cls(
             base64_content=base64_content,
@@ -137,39 +240,128 @@ class Image(BaseModel):
         """
         Get the image content as bytes.
         
+        Bytes decoded from base64 content or encoded from a transformed
+        image are cached until invalidate() is called.
+        
         Returns:
             The image content as bytes.
         """
         if self.content is not None:
             return self.content
         
+        if self._bytes is not None:
+            return self._bytes
+        
         if self.base64_content is not None:
-            return base64.b64decode(self.base64_content)
+            self._bytes = _b64.b64decode(self.base64_content, validate=False)
+            return self._bytes
         
         if self.path is not None:
             with open(self.path, "rb") as f:
                 return f.read()
         
         if self.url is not None:
-            import httpx
-            
-            response = httpx.get(self.url)
+            response = get_client().get(self.url)
             response.raise_for_status()
             return response.content
         
+        if self._pil is not None:
+            buffer = io.BytesIO()
+            self._pil.save(buffer, format=self._pil_format or "PNG")
+            self._bytes = buffer.getvalue()
+            return self._bytes
+        
         raise ValueError("No image content available")
     
+    async def to_bytes_async(self) -> bytes:
+        """
+        Get the image content as bytes without blocking the event loop on URLs.
+        
+        URL images are fetched with the shared asynchronous client, so
+        several images can be downloaded concurrently.
+        
+        Returns:
+            The image content as bytes.
+        """
+        if self.url is not None and self.content is None and self.base64_content is None and self.path is None:
+            response = await get_async_client().get(self.url, follow_redirects=True)
+            response.raise_for_status()
+            return response.content
+        
+        return self.to_bytes()
+    
     def to_base64(self) -> str:
         """
         Get the image content as base64-encoded string.
         
+        The encoded string is cached until invalidate() is called.
+        
         Returns:
             The base64-encoded image content.
         """
-        if self.base64_content is not None:
+        if isinstance(self.base64_content, str):
             return self.base64_content
         
-        return base64.b64encode(self.to_bytes()).decode("utf-8")
+        if self._base64 is None:
+            if self.base64_content is not None:
+                # Base64 content stored as ASCII bytes
+                self._base64 = self.base64_content.decode("ascii")
+            else:
+                buffer = self._to_buffer()
+                try:
+                    self._base64 = _b64encode_as_string(buffer)
+                finally:
+                    if isinstance(buffer, mmap.mmap):
+                        buffer.close()
+        
+        return self._base64
+    
+    def _is_file_backed(self) -> bool:
+        """
+        Check whether the image content is read from the file at path.
+        
+        Returns:
+            True if path is the first available image source.
+        """
+        return self.content is None and self.base64_content is None and self.path is not None
+    
+    def _to_buffer(self) -> Union[bytes, mmap.mmap]:
+        """
+        Get the image content as a bytes-like object.
+        
+        Files are memory-mapped instead of read into memory, so encoders
+        work directly on the page cache. The caller must close a returned
+        mmap once it is done with it.
+        
+        Returns:
+            The image content as bytes or a read-only mmap.
+        """
+        if self._is_file_backed():
+            with open(self.path, "rb") as f:
+                # Empty files cannot be mapped
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b""
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        return self.to_bytes()
+    
+    def invalidate(self) -> None:
+        """
+        Clear data cached from the image source.
+        
+        Call this after changing the content, base64_content, path or url
+        fields, or after modifying the PIL image returned by get_pil_image().
+        """
+        self._bytes = None
+        self._base64 = None
+        
+        # A decoded PIL image is only a cache when another source exists
+        if any(
+            value is not None
+            for value in (self.content, self.base64_content, self.path, self.url)
+        ):
+            self._pil = None
+            self._pil_format = None
     
     def to_data_url(self) -> str:
         """
@@ -196,9 +388,24 @@ class Image(BaseModel):
         # Create directory if it doesn't exist
         path_obj.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save image
-        with open(path_obj, "wb") as f:
-            f.write(self.to_bytes())
+        # Save image, streaming file and URL sources instead of loading them
+        if self.content is not None or self.base64_content is not None:
+            with open(path_obj, "wb") as f:
+                f.write(self.to_bytes())
+        elif self.path is not None:
+            if not (path_obj.exists() and os.path.samefile(self.path, path_obj)):
+                with open(self.path, "rb") as src, open(path_obj, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+        elif self.url is not None:
+            with get_client().stream("GET", self.url) as response:
+                response.raise_for_status()
+                with open(path_obj, "wb") as f:
+                    for chunk in response.iter_bytes(_CHUNK_SIZE):
+                        f.write(chunk)
+        elif self._pil is not None:
+            self._pil.save(path_obj, format=self._pil_format or "PNG")
+        else:
+            raise ValueError("No image content available")
         
         # Update path
         self.path = str(path_obj)
@@ -209,16 +416,25 @@ class Image(BaseModel):
         """
         Get the image as a PIL Image.
         
+        The decoded image is cached on the instance.
+        
         Returns:
             The image as a PIL Image.
         """
-        try:
-            from PIL import Image as PILImage
-            
-            return PILImage.open(io.BytesIO(self.to_bytes()))
-        except ImportError:
+        if self._pil is not None:
+            return self._pil
+        
+        if _PILImage is None:
             logger.error("PIL not installed. Install with 'pip install pillow'")
             raise ImportError("PIL not installed. Install with 'pip install pillow'")
+        
+        if self._is_file_backed():
+            # Let PIL read the file itself instead of copying it first
+            self._pil = _PILImage.open(self.path)
+        else:
+            self._pil = _PILImage.open(io.BytesIO(self.to_bytes()))
+        self._pil_format = self._pil.format
+        return self._pil
     
     def resize(self, width: int, height: int) -> "Image":
         """
@@ -232,17 +448,8 @@ class Image(BaseModel):
             The resized image.
         """
         pil_image = self.get_pil_image()
-        resized_image = pil_image.resize((width, height))
-        
-        # Convert back to bytes
-        buffer = io.BytesIO()
-        resized_image.save(buffer, format=pil_image.format or "PNG")
         
-        return Image.from_bytes(
-            buffer.getvalue(),
-            mime_type=self.mime_type,
-            **self.metadata,
-        )
+        return self._from_transformed(pil_image.resize((width, height)))
     
     def crop(self, x: int, y: int, width: int, height: int) -> "Image":
         """
@@ -258,14 +465,85 @@ class Image(BaseModel):
             The cropped image.
         """
         pil_image = self.get_pil_image()
-        cropped_image = pil_image.crop((x, y, x + width, y + height))
         
-        # Convert back to bytes
-        buffer = io.BytesIO()
-        cropped_image.save(buffer, format=pil_image.format or "PNG")
+        return self._from_transformed(pil_image.crop((x, y, x + width, y + height)))
+    
+    def _from_transformed(self, pil_image) -> "Image":
+        """
+        Create an Image backed by a transformed PIL image.
+        
+        The image is only encoded, in the source format, when its bytes
+        are requested or it is saved.
         
-        return Image.from_bytes(
-            buffer.getvalue(),
-            mime_type=self.mime_type,
-            **self.metadata,
-        )
\ No newline at end of file
+        Args:
+            pil_image: The transformed PIL image.
+            
+        Returns:
+            The new image.
+        """
+        image = Image(
+            mime_type=self.mime_type or "application/octet-stream",
+            metadata=dict(self.metadata),
+        )
+        image._pil = pil_image
+        image._pil_format = self._pil_format
+        
+        return image
+
+
+class ImageBatch:
+    """
+    Batch operations on images.
+    
+    Working on many images at once lets the base64 codec run over one
+    large buffer instead of paying per-call overhead for every image.
+    """
+    
+    @staticmethod
+    def to_base64_list(images: List[Image]) -> List[str]:
+        """
+        Get the base64-encoded content of several images.
+        
+        The images are concatenated at 3-byte aligned offsets, encoded with
+        a single call and the result is sliced per image. Encoded strings
+        are cached on the images like Image.to_base64().
+        
+        Args:
+            images: The images to encode.
+            
+        Returns:
+            The base64-encoded content of each image, in order.
+        """
+        results: List[Optional[str]] = []
+        pending = []
+        buffer = bytearray()
+        
+        for image in images:
+            if image.base64_content is not None or image._base64 is not None:
+                results.append(image.to_base64())
+                continue
+            
+            data = image.to_bytes()
+            pending.append((len(results), image, len(buffer), len(data)))
+            results.append(None)
+            
+            # Pad each image to a 3-byte boundary so it encodes independently
+            buffer += data
+            buffer += b"\0" * (-len(data) % 3)
+        
+        if pending:
+            encoded = _b64encode_as_string(buffer)
+            
+            for index, image, offset, size in pending:
+                start = offset // 3 * 4
+                value = encoded[start:start + (size + 2) // 3 * 4]
+                
+                # Replace the characters produced by the zero padding with "="
+                remainder = size % 3
+                if remainder:
+                    value = value[:remainder - 3] + "=" * (3 - remainder)
+                
+                image._base64 = value
+                results[index] = value
+        
+        return results
@@ -4,13 +4,80 @@ Prompts module for AytchMCP.
 This module provides reusable templates that help LLMs interact with the server effectively.
 """
 
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import os
-import json
+import string
 
 from loguru import logger
 
+from aytchmcp._json import loads
+
+
+# Maximum number of threads used to read prompt files
+_MAX_READ_WORKERS = 8
+
+
+def _read_prompt_file(path: str) -> Any:
+    """
+    Read a prompt file.
+    
+    Args:
+        path: The path to the prompt file.
+        
+    Returns:
+        The parsed data for JSON files, or the text for text files.
+    """
+    if path.endswith(".json"):
+        with open(path, "rb") as f:
+            return loads(f.read())
+    
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _compile_template(template: str) -> Optional[Callable[[Dict[str, Any]], str]]:
+    """
+    Compile a template into a function that formats it with an f-string.
+    
+    Only templates whose placeholders are plain names, optionally with a
+    !r, !s or !a conversion, are compiled.
+    
+    Args:
+        template: The template string with placeholders.
+        
+    Returns:
+        A function taking the variables dict, or None if the template
+        must be formatted with str.format.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    
+    names: Dict[str, str] = {}
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or format_spec or conversion not in (None, "r", "s", "a"):
+            return None
+        
+        # Bind each placeholder to a local so no quoting is needed inside the f-string
+        local = names.setdefault(field_name, f"_{len(names)}")
+        parts.append("{" + local + (f"!{conversion}" if conversion else "") + "}")
+    
+    lines = ["def _format(_kwargs):"]
+    lines += [f"    {local} = _kwargs[{name!r}]" for name, local in names.items()]
+    lines.append(f"    return f{''.join(parts)!r}")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_format"]
+
 
 class PromptTemplate:
     """
@@ -31,6 +98,7 @@ class PromptTemplate:
         self.template = template
         self.name = name
         self.description = description
+        self._format = _compile_template(template)
     
     def format(self, **kwargs) -> str:
         """
@@ -42,7 +110,35 @@ class PromptTemplate:
         Returns:
             The formatted prompt.
         """
-        return self.template.format(**kwargs)
+        if self._format is None:
+            return self.template.format(**kwargs)
+        return self._format(kwargs)
+
+
+# Prompt templates keyed by (template, name, description), reused across loads
+_template_pool: Dict[Tuple[str, str, str], PromptTemplate] = {}
+
+
+def _get_template(template: str, name: str, description: str) -> PromptTemplate:
+    """
+    Get a pooled prompt template, creating it if needed.
+    
+    Reloading an unchanged prompt reuses the existing template and its
+    compiled formatter.
+    
+    Args:
+        template: The template string with placeholders.
+        name: The name of the template.
+        description: The description of the template.
+        
+    Returns:
+        The prompt template.
+    """
+    key = (template, name, description)
+    prompt_template = _template_pool.get(key)
+    if prompt_template is None:
+        prompt_template = _template_pool[key] = PromptTemplate(template, name, description)
+    return prompt_template
 
 
 class PromptLibrary:
@@ -66,37 +162,39 @@ class PromptLibrary:
             logger.warning(f"Prompts directory not found: {prompts_dir}")
             return
         
-        # Load prompts from JSON files
-        for file_path in prompts_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    prompt_data = json.load(f)
-                
-                # Create prompt template
-                template = PromptTemplate(
-                    template=prompt_data["template"],
-                    name=prompt_data.get("name", file_path.stem),
-                    description=prompt_data.get("description", ""),
-                )
-                
-                # Add to library
-                self._prompts[template.name] = template
-                logger.info(f"Loaded prompt template: {template.name}")
-            except Exception as e:
-                logger.error(f"Error loading prompt template from {file_path}: {e}")
+        # Find JSON and text prompt files in a single directory scan
+        with os.scandir(prompts_dir) as entries:
+            files = [entry for entry in entries if entry.is_file()]
         
-        # Load prompts from text files
-        for file_path in prompts_dir.glob("*.txt"):
+        # JSON prompts are loaded first so text prompts override them
+        paths = [entry.path for entry in files if entry.name.endswith(".json")]
+        paths += [entry.path for entry in files if entry.name.endswith(".txt")]
+        
+        if not paths:
+            return
+        
+        # Read files concurrently
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(paths))) as executor:
+            futures = [executor.submit(_read_prompt_file, path) for path in paths]
+        
+        for file_path, future in zip(paths, futures):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    template_text = f.read()
+                prompt_data = future.result()
+                stem = os.path.splitext(os.path.basename(file_path))[0]
                 
                 # Create prompt template
-                template = PromptTemplate(
-                    template=template_text,
-                    name=file_path.stem,
-                    description="",
-                )
+                if file_path.endswith(".json"):
+                    template = _get_template(
+                        template=prompt_data["template"],
+                        name=prompt_data.get("name", stem),
+                        description=prompt_data.get("description", ""),
+                    )
+                else:
+                    template = _get_template(
+                        template=prompt_data,
+                        name=stem,
+                        description="",
+                    )
                 
                 # Add to library
                 self._prompts[template.name] = template
@@ -119,11 +217,10 @@ class PromptLibrary:
         prompts_config_path = config_path / "prompts.json"
         if prompts_config_path.exists():
             try:
-                with open(prompts_config_path, "r") as f:
-                    prompts_config = json.load(f)
-                    
-                    if "prompts_dir" in prompts_config:
-                        return Path(prompts_config["prompts_dir"])
+                prompts_config = loads(prompts_config_path.read_bytes())
+                
+                if "prompts_dir" in prompts_config:
+                    return Path(prompts_config["prompts_dir"])
             except Exception as e:
                 logger.error(f"Error loading prompts config: {e}")
         
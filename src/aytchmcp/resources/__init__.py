@@ -24,6 +24,11 @@ _RESOURCES: Dict[str, Type[Resource]] = {
     "documentation": DocumentationResource,
 }
 
+# Shared resource instances; resources keep no per-request state
+_RESOURCE_INSTANCES: Dict[str, Resource] = {
+    name: resource_class() for name, resource_class in _RESOURCES.items()
+}
+
 
 def get_available_resources() -> List[str]:
     """
@@ -48,8 +53,8 @@ def get_resources(enabled_resources: List[str]) -> List[Resource]:
     resources = []
     
     for name in enabled_resources:
-        if name in _RESOURCES:
-            resource_class = _RESOURCES[name]
-            resources.append(resource_class())
+        resource = _RESOURCE_INSTANCES.get(name)
+        if resource is not None:
+            resources.append(resource)
     
     return resources
\ No newline at end of file
@@ -4,15 +4,16 @@ Documentation Resource for AytchMCP.
 This resource provides documentation to LLMs.
 """
 
+import asyncio
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Any
 
 from fastmcp.resources import Resource
 from pydantic import BaseModel, Field
 
 from aytchmcp.context import Context
-from aytchmcp.config import config
 
 
 class DocumentationEntry(BaseModel):
@@ -37,6 +38,215 @@ class DocumentationResponse(BaseModel):
     )
 
 
+# Frontmatter block at the start of a file, and the tags line inside it
+_FRONTMATTER_RE = re.compile(r"---(.*?)---", re.S)
+_TAG_LINE_RE = re.compile(r"^tags:(.*)$", re.M)
+
+
+def _extract_tags(content: str) -> List[str]:
+    """
+    Extract tags from frontmatter.
+    
+    Args:
+        content: The content to extract tags from.
+        
+    Returns:
+        List of tags.
+    """
+    frontmatter = _FRONTMATTER_RE.match(content)
+    if frontmatter is None:
+        return []
+    
+    # The last tags line wins
+    tag_lines = _TAG_LINE_RE.findall(frontmatter.group(1).strip())
+    if not tag_lines:
+        return []
+    tags_str = tag_lines[-1].strip()
+    
+    # Parse tags
+    if tags_str.startswith("[") and tags_str.endswith("]"):
+        # Array format: tags: [tag1, tag2]
+        tags_str = tags_str[1:-1]
+    
+    # List format: tags: tag1, tag2
+    return [tag.strip().strip("'\"") for tag in tags_str.split(",")]
+
+
+def _iter_markdown_files(directory: str) -> Iterator[Tuple[str, float]]:
+    """
+    Recursively find markdown files.
+    
+    Uses os.scandir so file types and modification times come from the
+    directory listing without extra stat calls where the OS allows it.
+    
+    Args:
+        directory: The directory to search.
+        
+    Yields:
+        Tuples of (file path, modification time).
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_markdown_files(entry.path)
+            elif entry.name.endswith(".md") and entry.is_file():
+                yield entry.path, entry.stat().st_mtime
+
+
+class _IndexedDocument(NamedTuple):
+    """A documentation file held in the index."""
+    
+    path: str
+    mtime: float
+    title: str
+    content: str
+    folded: bytes
+    tags: List[str]
+
+
+def _read_document(file_path: str, path: str, mtime: float) -> _IndexedDocument:
+    """
+    Read and parse a documentation file.
+    
+    Args:
+        file_path: The path to the file.
+        path: The path relative to the documentation directory.
+        mtime: The modification time of the file.
+        
+    Returns:
+        The parsed document.
+    """
+    # Read file content
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    
+    return _IndexedDocument(
+        path=path,
+        mtime=mtime,
+        title=content.split("\n")[0].strip("# "),
+        content=content,
+        folded=content.casefold().encode("utf-8"),
+        tags=_extract_tags(content),
+    )
+
+
+class _DocumentationIndex:
+    """
+    Cache of the markdown files in a documentation directory, with a tag index.
+    
+    Files are only read again when their modification time changes.
+    """
+    
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = docs_dir
+        self.documents: Dict[str, _IndexedDocument] = {}
+        self.tag_index: Dict[str, Set[str]] = {}
+        
+        # Refresh lock, created on the loop that uses it; before Python 3.10 a
+        # lock is bound to the event loop that was current when it was created
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def refresh(self) -> None:
+        """
+        Bring the index up to date with the documentation directory.
+        
+        New and modified files are read concurrently in worker threads.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        
+        async with self._lock:
+            root = str(self.docs_dir)
+            scanned = [
+                (os.path.relpath(file_path, root), file_path, mtime)
+                for file_path, mtime in _iter_markdown_files(root)
+            ]
+            
+            # Read new and modified files
+            reads = []
+            for path, file_path, mtime in scanned:
+                document = self.documents.get(path)
+                if document is None or document.mtime != mtime:
+                    reads.append(asyncio.to_thread(_read_document, file_path, path, mtime))
+            updated = {document.path: document for document in await asyncio.gather(*reads)}
+            
+            documents: Dict[str, _IndexedDocument] = {}
+            for path, _, _ in scanned:
+                document = updated.get(path)
+                if document is None:
+                    document = self.documents.pop(path)
+                else:
+                    previous = self.documents.pop(path, None)
+                    if previous is not None:
+                        self._remove(previous)
+                    self._add(document)
+                
+                documents[path] = document
+            
+            # Drop files that no longer exist
+            for document in self.documents.values():
+                self._remove(document)
+            
+            self.documents = documents
+    
+    def search(
+        self, query: Optional[str] = None, tags: Optional[List[str]] = None
+    ) -> List[_IndexedDocument]:
+        """
+        Find the documents matching a query and tags.
+        
+        Args:
+            query: Optional text the document content must contain.
+            tags: Optional tags, at least one of which the document must have.
+            
+        Returns:
+            The matching documents, in directory scan order.
+        """
+        candidates: Optional[Set[str]] = None
+        
+        # Filter by tags if provided
+        if tags:
+            candidates = set()
+            for tag in tags:
+                candidates |= self.tag_index.get(tag, set())
+        
+        needle = query.casefold().encode("utf-8") if query else None
+        
+        results = []
+        for path, document in self.documents.items():
+            if candidates is not None and path not in candidates:
+                continue
+            
+            # Filter by query as a substring of the casefolded content
+            if needle and document.folded.find(needle) < 0:
+                continue
+            
+            results.append(document)
+        
+        return results
+    
+    def _add(self, document: _IndexedDocument) -> None:
+        """Add a document's tags to the index."""
+        for tag in document.tags:
+            self.tag_index.setdefault(tag, set()).add(document.path)
+    
+    def _remove(self, document: _IndexedDocument) -> None:
+        """Remove a document's tags from the index."""
+        for tag in document.tags:
+            paths = self.tag_index.get(tag)
+            if paths is not None:
+                paths.discard(document.path)
+                if not paths:
+                    del self.tag_index[tag]
+
+
+# Documentation indexes keyed by documentation directory
+_indexes: Dict[Path, _DocumentationIndex] = {}
+
+
 class DocumentationResource(Resource):
     """Resource that provides documentation."""
     
@@ -60,7 +270,7 @@ class DocumentationResource(Resource):
             Documentation entries.
         """
         # Get documentation entries
-        entries = self._get_documentation_entries(query, tags)
+        entries = await self._get_documentation_entries(query, tags)
         
         return DocumentationResponse(
             entries=entries,
@@ -68,7 +278,7 @@ class DocumentationResource(Resource):
             query=query,
         )
     
-    def _get_documentation_entries(
+    async def _get_documentation_entries(
         self, query: Optional[str] = None, tags: Optional[List[str]] = None
     ) -> List[DocumentationEntry]:
         """
@@ -81,52 +291,28 @@ class DocumentationResource(Resource):
         Returns:
             List of documentation entries.
         """
-        entries = []
-        
         # Get documentation directory
         docs_dir = self._get_docs_dir()
         
         if not docs_dir.exists():
-            return entries
+            return []
         
-        # Get all markdown files
-        markdown_files = list(docs_dir.glob("**/*.md"))
+        # Update the index for files added, changed or removed since last time
+        index = _indexes.get(docs_dir)
+        if index is None:
+            index = _indexes[docs_dir] = _DocumentationIndex(docs_dir)
+        await index.refresh()
         
-        for file_path in markdown_files:
-            # Read file content
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            # Extract title from first line
-            title = content.split("\n")[0].strip("# ")
-            
-            # Extract tags from frontmatter
-            file_tags = self._extract_tags(content)
-            
-            # Filter by tags if provided
-            if tags and not any(tag in file_tags for tag in tags):
-                continue
-            
-            # Filter by query if provided
-            if query and query.lower() not in content.lower() and query.lower() not in title.lower():
-                continue
-            
-            # Get last modified timestamp
-            last_modified = os.path.getmtime(file_path)
-            last_modified_str = str(last_modified)
-            
-            # Create entry
-            entry = DocumentationEntry(
-                title=title,
-                content=content,
-                path=str(file_path.relative_to(docs_dir)),
-                tags=file_tags,
-                last_modified=last_modified_str,
+        return [
+            DocumentationEntry(
+                title=document.title,
+                content=document.content,
+                path=document.path,
+                tags=document.tags,
+                last_modified=str(document.mtime),
             )
-            
-            entries.append(entry)
-        
-        return entries
+            for document in index.search(query, tags)
+        ]
     
     def _get_docs_dir(self) -> Path:
         """
@@ -163,26 +349,4 @@ class DocumentationResource(Resource):
         Returns:
             List of tags.
         """
-        tags = []
-        
-        # Check if content has frontmatter
-        if content.startswith("---"):
-            # Extract frontmatter
-            frontmatter_end = content.find("---", 3)
-            if frontmatter_end != -1:
-                frontmatter = content[3:frontmatter_end].strip()
-                
-                # Extract tags
-                for line in frontmatter.split("\n"):
-                    if line.startswith("tags:"):
-                        tags_str = line[5:].strip()
-                        
-                        # Parse tags
-                        if tags_str.startswith("[") and tags_str.endswith("]"):
-                            # Array format: tags: [tag1, tag2]
-                            tags = [tag.strip().strip("'\"") for tag in tags_str[1:-1].split(",")]
-                        else:
-                            # List format: tags: tag1, tag2
-                            tags = [tag.strip().strip("'\"") for tag in tags_str.split(",")]
-        
-        return tags
\ No newline at end of file
+        return _extract_tags(content)
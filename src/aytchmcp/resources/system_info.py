@@ -8,14 +8,22 @@ import os
 import platform
 import socket
 import sys
+import time
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Any
 
 from fastmcp.resources import Resource
 from pydantic import BaseModel, Field
 
 from aytchmcp.context import Context
 
+# psutil is optional
+try:
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
 
 class SystemInfo(BaseModel):
     """System information model."""
@@ -33,6 +41,44 @@ class SystemInfo(BaseModel):
     )
 
 
+# Seconds a system information snapshot is reused
+_SYSTEM_INFO_TTL = 1.0
+
+# Last system information snapshot as (monotonic time, info)
+_system_info_cache: Optional[Tuple[float, SystemInfo]] = None
+
+
+@lru_cache(maxsize=1)
+def _get_static_info() -> Tuple[str, str, str, str, int]:
+    """
+    Get the basic system information that does not change while the server runs.
+    
+    It is read on first use rather than at import, so a failure only affects
+    the resource call.
+    
+    Returns:
+        The hostname, platform name, platform version, Python version and CPU count.
+    """
+    return (
+        socket.gethostname(),
+        platform.system(),
+        platform.version(),
+        sys.version,
+        os.cpu_count() or 0,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_boot_time() -> float:
+    """
+    Get the system boot time, which is fixed for the life of the process.
+    
+    Returns:
+        The boot time as a Unix timestamp.
+    """
+    return _psutil.boot_time()
+
+
 class SystemInfoResource(Resource):
     """Resource that provides system information."""
     
@@ -51,18 +97,12 @@ class SystemInfoResource(Resource):
         Returns:
             System information.
         """
-        # Get basic system information
-        hostname = socket.gethostname()
-        platform_name = platform.system()
-        platform_version = platform.version()
-        python_version = sys.version
-        
-        # Get CPU count
-        try:
-            import multiprocessing
-            cpu_count = multiprocessing.cpu_count()
-        except (ImportError, NotImplementedError):
-            cpu_count = 0
+        global _system_info_cache
+        
+        # Reuse a recent snapshot
+        now = time.monotonic()
+        if _system_info_cache is not None and now - _system_info_cache[0] < _SYSTEM_INFO_TTL:
+            return _system_info_cache[1]
         
         # Get memory information
         memory_info = self._get_memory_info()
@@ -82,7 +122,9 @@ class SystemInfoResource(Resource):
             "HOME": os.environ.get("HOME", ""),
         }
         
-        return SystemInfo(
+        hostname, platform_name, platform_version, python_version, cpu_count = _get_static_info()
+        
+        system_info = SystemInfo(
             hostname=hostname,
             platform=platform_name,
             platform_version=platform_version,
@@ -93,6 +135,10 @@ class SystemInfoResource(Resource):
             uptime=uptime,
             environment_variables=env_vars,
         )
+        
+        _system_info_cache = (now, system_info)
+        
+        return system_info
     
     def _get_memory_info(self) -> Dict[str, Any]:
         """
@@ -103,24 +149,23 @@ class SystemInfoResource(Resource):
         """
         memory_info = {}
         
-        try:
-            import psutil
-            
-            # Get virtual memory
-            virtual_memory = psutil.virtual_memory()
-            memory_info["total"] = virtual_memory.total
-            memory_info["available"] = virtual_memory.available
-            memory_info["used"] = virtual_memory.used
-            memory_info["percent"] = virtual_memory.percent
-            
-            # Get swap memory
-            swap_memory = psutil.swap_memory()
-            memory_info["swap_total"] = swap_memory.total
-            memory_info["swap_used"] = swap_memory.used
-            memory_info["swap_free"] = swap_memory.free
-            memory_info["swap_percent"] = swap_memory.percent
-        except ImportError:
+        if _psutil is None:
             memory_info["error"] = "psutil not available"
+            return memory_info
+        
+        # Get virtual memory
+        virtual_memory = _psutil.virtual_memory()
+        memory_info["total"] = virtual_memory.total
+        memory_info["available"] = virtual_memory.available
+        memory_info["used"] = virtual_memory.used
+        memory_info["percent"] = virtual_memory.percent
+        
+        # Get swap memory
+        swap_memory = _psutil.swap_memory()
+        memory_info["swap_total"] = swap_memory.total
+        memory_info["swap_used"] = swap_memory.used
+        memory_info["swap_free"] = swap_memory.free
+        memory_info["swap_percent"] = swap_memory.percent
         
         return memory_info
     
@@ -131,18 +176,12 @@ class SystemInfoResource(Resource):
         Returns:
             System uptime as a string.
         """
-        try:
-            import psutil
-            
-            # Get boot time
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.now() - boot_time
-            
-            # Format uptime
-            days = uptime.days
-            hours, remainder = divmod(uptime.seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            
-            return f"{days} days, {hours} hours, {minutes} minutes, {seconds} seconds"
-        except ImportError:
-            return "Unknown (psutil not available)"
\ No newline at end of file
+        if _psutil is None:
+            return "Unknown (psutil not available)"
+        
+        # Format uptime
+        days, remainder = divmod(int(time.time() - _get_boot_time()), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        
+        return f"{days} days, {hours} hours, {minutes} minutes, {seconds} seconds"
\ No newline at end of file
@@ -7,53 +7,85 @@ This module provides the main server implementation for the AytchMCP server.
 import asyncio
 import logging
 import sys
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastmcp import FastMCP
 from fastmcp.resources import Resource
 from fastmcp.tools import Tool
 from loguru import logger
 
-from aytchmcp.config import config
+from aytchmcp._json import dumps, orjson
+from aytchmcp.config import get_config
 from aytchmcp.resources import get_resources
 from aytchmcp.tools import get_tools
 from aytchmcp.context import Context
+from aytchmcp.http_client import aclose_clients
+
+# uvloop is optional; uvicorn[standard] installs it on supported platforms
+try:
+    from uvloop import run as _uvloop_run
+except ImportError:
+    _uvloop_run = None
+
+
+# Encode JSON responses with orjson when it is installed
+_JSONResponse = ORJSONResponse if orjson is not None else JSONResponse
 
 
 # Configure logging
-def setup_logging():
-    """Configure logging for the application."""
+def setup_logging(log_file: bool = True):
+    """
+    Configure logging for the application.
+    
+    Args:
+        log_file: Whether to also log to the rotating file in logs/. Worker
+            processes must not share it, since each one would rotate it.
+    """
+    config = get_config()
     log_level = getattr(logging, config.server.log_level)
     
     # Remove default loguru handler
     logger.remove()
     
-    # Add custom handler
+    # Add custom handler; enqueue=True writes from a background thread
+    # so logging never blocks the event loop
     logger.add(
         sys.stderr,
         level=log_level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        enqueue=True,
     )
     
-    # Also add a file handler
-    logger.add(
-        "logs/aytchmcp.log",
-        rotation="10 MB",
-        retention="1 week",
-        level=log_level,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    )
+    # Also add a buffered file handler
+    if log_file:
+        logger.add(
+            "logs/aytchmcp.log",
+            rotation="10 MB",
+            retention="1 week",
+            level=log_level,
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            enqueue=True,
+            buffering=65536,
+        )
 
 
 class AytchMCPServer:
     """AytchMCP Server implementation."""
 
-    def __init__(self):
-        """Initialize the AytchMCP server."""
-        setup_logging()
+    def __init__(self, log_file: bool = True):
+        """
+        Initialize the AytchMCP server.
+        
+        Args:
+            log_file: Whether to also log to the rotating file in logs/.
+        """
+        setup_logging(log_file)
+        
+        config = get_config()
         
         # Create FastAPI app
         self.app = FastAPI(
@@ -62,6 +94,8 @@ class AytchMCPServer:
             version="0.1.0",
             docs_url="/docs",
             redoc_url="/redoc",
+            default_response_class=_JSONResponse,
+            lifespan=self._lifespan,
         )
         
         # Add CORS middleware
@@ -86,85 +120,190 @@ class AytchMCPServer:
         # Add routes
         self._setup_routes()
         
-        logger.info(f"AytchMCP Server initialized with config: {config}")
+        # uvicorn settings, resolved once
+        self._uvicorn_config = {
+            "host": config.server.host,
+            "port": config.server.port,
+            "log_level": config.server.log_level.lower(),
+            "reload": config.server.debug,
+        }
+        
+        logger.info("AytchMCP Server initialized with config: {}", config)
 
     def _register_resources(self):
         """Register resources with the MCP server."""
-        resources = get_resources(config.resources_enabled)
+        resources = get_resources(get_config().resources_enabled)
         for resource in resources:
             self.mcp_server.add_resource(resource)
-            logger.info(f"Registered resource: {resource.name}")
+            logger.debug("Registered resource: {}", resource.name)
 
     def _register_tools(self):
         """Register tools with the MCP server."""
-        tools = get_tools(config.tools_enabled)
-        for tool_info in tools:
+        tools = get_tools(get_config().tools_enabled)
+        for tool in tools:
             self.mcp_server.add_tool(
-                fn=tool_info["function"],
-                name=tool_info["name"],
-                description=tool_info["description"]
+                fn=tool.function,
+                name=tool.name,
+                description=tool.description
             )
-            logger.info(f"Registered tool: {tool_info['name']}")
+            logger.debug("Registered tool: {}", tool.name)
 
     def _setup_routes(self):
         """Set up FastAPI routes."""
+        config = get_config()
+        
+        # Resources and tools are registered once, so encode the metadata once
+        resource_names = [r.name for r in self.mcp_server.resources]
+        tool_names = [t.name for t in self.mcp_server.tools]
+        root_json = dumps({
+            "name": config.branding.name,
+            "description": config.branding.description,
+            "version": "0.1.0",
+            "resources": resource_names,
+            "tools": tool_names,
+        })
+        resources_json = dumps({"resources": resource_names})
+        tools_json = dumps({"tools": tool_names})
+        health_json = dumps({"status": "ok"})
+        
         # Create MCP routes
         @self.app.get("/.well-known/mcp")
         async def mcp_root():
             """MCP root endpoint."""
-            return {
-                "name": config.branding.name,
-                "description": config.branding.description,
-                "version": "0.1.0",
-                "resources": [r.name for r in self.mcp_server.resources],
-                "tools": [t.name for t in self.mcp_server.tools],
-            }
+            return Response(content=root_json, media_type="application/json")
         
         @self.app.get("/.well-known/mcp/resources")
         async def mcp_resources():
             """MCP resources endpoint."""
-            return {"resources": [r.name for r in self.mcp_server.resources]}
+            return Response(content=resources_json, media_type="application/json")
         
         @self.app.get("/.well-known/mcp/tools")
         async def mcp_tools():
             """MCP tools endpoint."""
-            return {"tools": [t.name for t in self.mcp_server.tools]}
+            return Response(content=tools_json, media_type="application/json")
         
         # Add health check endpoint
         @self.app.get("/health")
         async def health_check():
-            return {"status": "ok"}
+            return Response(content=health_json, media_type="application/json")
         
         # Add custom error handler
         @self.app.exception_handler(Exception)
         async def exception_handler(request: Request, exc: Exception):
-            logger.error(f"Unhandled exception: {exc}", exc_info=True)
-            return JSONResponse(
+            logger.error("Unhandled exception: {}", exc)
+            return _JSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error"},
             )
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """
+        Prepare the serving event loop and release shared resources on shutdown.
+        
+        This runs on the loop that serves requests, both in single-process
+        mode and in each worker process.
+        """
+        # Run coroutines that finish without awaiting eagerly (Python 3.12+)
+        if sys.version_info >= (3, 12):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
+        yield
+        await self.stop()
+
     async def start(self):
         """Start the AytchMCP server."""
         import uvicorn
         
-        logger.info(f"Starting AytchMCP server on {config.server.host}:{config.server.port}")
-        
-        config_dict = {
-            "host": config.server.host,
-            "port": config.server.port,
-            "log_level": config.server.log_level.lower(),
-            "reload": config.server.debug,
-        }
+        logger.info(
+            "Starting AytchMCP server on {}:{}",
+            self._uvicorn_config["host"],
+            self._uvicorn_config["port"],
+        )
         
-        server = uvicorn.Server(uvicorn.Config(self.app, **config_dict))
+        server = uvicorn.Server(uvicorn.Config(self.app, **self._uvicorn_config))
         await server.serve()
 
+    async def stop(self):
+        """Stop the AytchMCP server and release shared resources."""
+        await aclose_clients()
+        
+        logger.info("AytchMCP server stopped")
+        
+        # Flush messages still queued for the log sinks
+        await logger.complete()
+
+
+def run_async(coro):
+    """
+    Run a coroutine on a new event loop, using uvloop when it is installed.
+    
+    The server runs on the loop created here, since uvicorn only selects
+    its event loop when it creates the loop itself. No global event loop
+    policy is installed.
+    
+    Args:
+        coro: The coroutine to run.
+        
+    Returns:
+        The result of the coroutine.
+    """
+    if _uvloop_run is not None:
+        return _uvloop_run(coro)
+    
+    return asyncio.run(coro)
+
+
+def create_app() -> FastAPI:
+    """
+    Create the FastAPI application.
+    
+    Used as the uvicorn application factory in each worker process. Workers
+    log to stderr only, since they cannot safely share the rotating log file.
+    
+    Returns:
+        The FastAPI application.
+    """
+    return AytchMCPServer(log_file=False).app
+
+
+def serve():
+    """
+    Run the AytchMCP server.
+    
+    With more than one worker configured, uvicorn runs each worker in its
+    own process. Workers are not used in debug mode, since reloading
+    requires a single process.
+    """
+    config = get_config()
+    
+    if config.server.workers > 1 and not config.server.debug:
+        import uvicorn
+        
+        logger.info(
+            "Starting AytchMCP server on {}:{} with {} workers",
+            config.server.host,
+            config.server.port,
+            config.server.workers,
+        )
+        
+        uvicorn.run(
+            "aytchmcp.server:create_app",
+            factory=True,
+            host=config.server.host,
+            port=config.server.port,
+            log_level=config.server.log_level.lower(),
+            workers=config.server.workers,
+        )
+        return
+    
+    server = AytchMCPServer()
+    run_async(server.start())
+
 
 def main():
     """Run the AytchMCP server."""
-    server = AytchMCPServer()
-    asyncio.run(server.start())
+    serve()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ This module provides tools that allow LLMs to take actions through the server.
 Unlike resources, tools are expected to perform computation and have side effects.
 """
 
-from typing import Dict, List, Any, Callable
+from typing import Dict, List, Any, Callable, NamedTuple
 
 from aytchmcp.context import Context
 
@@ -16,23 +16,31 @@ from .weather import weather_tool
 from .calculator import calculator_tool
 
 
+class ToolSpec(NamedTuple):
+    """A tool function and its metadata."""
+    
+    function: Callable[..., Any]
+    name: str
+    description: str
+
+
 # Tool registry with metadata
-_TOOLS: Dict[str, Dict[str, Any]] = {
-    "echo": {
-        "function": echo_tool,
-        "name": "echo",
-        "description": "Echoes back the input message, optionally with a prefix and/or in uppercase",
-    },
-    "weather": {
-        "function": weather_tool,
-        "name": "weather",
-        "description": "Get weather information for a location",
-    },
-    "calculator": {
-        "function": calculator_tool,
-        "name": "calculator",
-        "description": "Evaluates mathematical expressions and performs calculations",
-    },
+_TOOLS: Dict[str, ToolSpec] = {
+    "echo": ToolSpec(
+        function=echo_tool,
+        name="echo",
+        description="Echoes back the input message, optionally with a prefix and/or in uppercase",
+    ),
+    "weather": ToolSpec(
+        function=weather_tool,
+        name="weather",
+        description="Get weather information for a location",
+    ),
+    "calculator": ToolSpec(
+        function=calculator_tool,
+        name="calculator",
+        description="Evaluates mathematical expressions and performs calculations",
+    ),
 }
 
 
@@ -46,7 +54,7 @@ def get_available_tools() -> List[str]:
     return list(_TOOLS.keys())
 
 
-def get_tools(enabled_tools: List[str]) -> List[Dict[str, Any]]:
+def get_tools(enabled_tools: List[str]) -> List[ToolSpec]:
     """
     Get a list of tool functions and metadata for the enabled tools.
     
@@ -54,12 +62,13 @@ def get_tools(enabled_tools: List[str]) -> List[Dict[str, Any]]:
         enabled_tools: A list of tool names to enable.
         
     Returns:
-        A list of tool functions and metadata.
+        A list of tool specs.
     """
     tools = []
     
     for name in enabled_tools:
-        if name in _TOOLS:
-            tools.append(_TOOLS[name])
+        tool = _TOOLS.get(name)
+        if tool is not None:
+            tools.append(tool)
     
     return tools
\ No newline at end of file
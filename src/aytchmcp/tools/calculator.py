@@ -4,12 +4,15 @@ Calculator Tool for AytchMCP.
 This tool provides basic and advanced calculation capabilities.
 """
 
+import ast
 import math
 import re
+from functools import lru_cache
+from types import CodeType
 from typing import Dict, Any, Optional, Union, List
 
 from fastmcp.tools import Tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from aytchmcp.context import Context
 
@@ -17,6 +20,8 @@ from aytchmcp.context import Context
 class CalculatorInput(BaseModel):
     """Calculator tool input model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     expression: str = Field(
         description="The mathematical expression to evaluate"
     )
@@ -33,6 +38,8 @@ class CalculatorInput(BaseModel):
 class CalculatorOutput(BaseModel):
     """Calculator tool output model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     result: Union[float, int, str] = Field(
         description="The result of the calculation"
     )
@@ -90,6 +97,18 @@ _safe_constants = {
     'nan': math.nan,
 }
 
+# Evaluation globals shared by every call; per-call variables are overlaid
+_BASE_ENV = {"__builtins__": {}, **_safe_functions, **_safe_constants}
+
+# Characters removed from expressions before evaluation
+_UNSAFE_RE = re.compile(r'[^0-9+\-*/().,%\s\w]')
+
+# The same ASCII characters as a bytes.translate() delete table
+_UNSAFE_ASCII = bytes(c for c in range(128) if _UNSAFE_RE.match(chr(c)))
+
+# Expressions made only of numbers and arithmetic operators
+_SIMPLE_ARITH_RE = re.compile(r'^[\d\s+\-*/().]+$')
+
 async def calculator_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculator tool that evaluates mathematical expressions.
@@ -101,15 +120,11 @@ async def calculator_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
         The calculation result.
     """
     # Parse input
-    parsed_input = CalculatorInput(**input_data)
+    parsed_input = CalculatorInput.model_validate(input_data)
     
     try:
-        # Prepare variables
-        variables = {}
-        variables.update(_safe_constants)
-        
-        if parsed_input.variables:
-            variables.update(parsed_input.variables)
+        # Prepare variables (constants are already in the base environment)
+        variables = parsed_input.variables or {}
         
         # Clean and validate the expression
         expression = _clean_expression(parsed_input.expression)
@@ -132,18 +147,19 @@ async def calculator_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
             steps=steps,
         )
         
-        return output.dict()
+        return output.model_dump()
     except Exception as e:
         # Log error
         from loguru import logger
         logger.error(f"Calculator error: {e}")
         
-        output = CalculatorOutput(
-            result="Error",
-            formatted_result="Error",
-            error=str(e),
-        )
-        return output.dict()
+        # The error output has a fixed shape, so build the CalculatorOutput dict directly
+        return {
+            "result": "Error",
+            "formatted_result": "Error",
+            "steps": None,
+            "error": str(e),
+        }
 
 def _clean_expression(expression: str) -> str:
     """
@@ -155,14 +171,20 @@ def _clean_expression(expression: str) -> str:
     Returns:
         The cleaned expression.
     """
-    # Remove any potentially unsafe characters
-    expression = re.sub(r'[^0-9+\-*/().,%\s\w]', '', expression)
+    # Most expressions are already clean; searching stops at the first unsafe character
+    if '%' not in expression and _UNSAFE_RE.search(expression) is None:
+        return expression
     
-    # Replace % with /100*
-    expression = expression.replace('%', '/100*')
+    # Remove any potentially unsafe characters (including '^'), in a single
+    # C-level pass for ASCII input
+    if expression.isascii():
+        expression = expression.encode('ascii').translate(None, _UNSAFE_ASCII).decode('ascii')
+    else:
+        expression = _UNSAFE_RE.sub('', expression)
     
-    # Replace ^ with **
-    expression = expression.replace('^', '**')
+    # Replace % with /100*
+    if '%' in expression:
+        expression = expression.replace('%', '/100*')
     
     return expression
 
@@ -180,30 +202,64 @@ def _evaluate_expression(expression: str, variables: Dict[str, Any]) -> tuple[Un
     steps = []
     
     # Check for simple arithmetic
-    if re.match(r'^[\d\s+\-*/().]+$', expression):
+    if _SIMPLE_ARITH_RE.match(expression):
         # Simple arithmetic expression
         steps.append(f"Evaluating arithmetic expression: {expression}")
-        result = eval(expression, {"__builtins__": {}}, {})
+        result = _evaluate_cached(expression, ())
         steps.append(f"Result: {result}")
         return result, steps
     
-    # Check for function calls
-    function_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-    functions_used = re.findall(function_pattern, expression)
-    
-    # Validate functions
-    for func_name in functions_used:
-        if func_name not in _safe_functions:
-            raise ValueError(f"Function '{func_name}' is not allowed")
-    
-    # Create a safe environment with allowed functions
-    safe_env = {"__builtins__": {}}
-    safe_env.update(_safe_functions)
-    safe_env.update(variables)
-    
     # Evaluate the expression
     steps.append(f"Evaluating expression: {expression}")
-    result = eval(expression, safe_env, {})
+    result = _evaluate_cached(expression, tuple(variables.items()) if variables else ())
     steps.append(f"Result: {result}")
     
-    return result, steps
\ No newline at end of file
+    return result, steps
+
+@lru_cache(maxsize=1024)
+def _evaluate_cached(expression: str, variables: tuple[tuple[str, Any], ...]) -> Union[float, int, str]:
+    """
+    Evaluate the expression in a safe environment.
+    
+    Every allowed function is pure, so results are memoized by expression
+    and variable values.
+    
+    Args:
+        expression: The expression to evaluate.
+        variables: Variables to use in the expression, as (name, value) pairs.
+        
+    Returns:
+        The result.
+    """
+    # Use the shared safe environment, copying it only to add variables
+    safe_env = {**_BASE_ENV, **dict(variables)} if variables else _BASE_ENV
+    
+    return eval(_compile(expression), safe_env, {})
+
+@lru_cache(maxsize=1024)
+def _compile(expression: str) -> CodeType:
+    """
+    Parse, validate and compile the expression.
+    
+    Only calls to the allowed functions are accepted, and attribute access
+    is rejected.
+    
+    Args:
+        expression: The expression to compile.
+        
+    Returns:
+        The compiled expression.
+    """
+    tree = ast.parse(expression, '<string>', mode='eval')
+    
+    # Validate functions and reject attribute access
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name):
+                raise ValueError("Only calls to allowed functions are supported")
+            if node.func.id not in _safe_functions:
+                raise ValueError(f"Function '{node.func.id}' is not allowed")
+        elif isinstance(node, ast.Attribute):
+            raise ValueError("Attribute access is not allowed")
+    
+    return compile(tree, '<calculator>', 'eval')
@@ -4,15 +4,18 @@ Echo Tool for AytchMCP.
 This tool simply echoes back the input, useful for testing.
 """
 
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EchoInput(BaseModel):
     """Echo tool input model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     message: str = Field(
         description="The message to echo back"
     )
@@ -29,6 +32,8 @@ class EchoInput(BaseModel):
 class EchoOutput(BaseModel):
     """Echo tool output model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     message: str = Field(
         description="The echoed message"
     )
@@ -37,6 +42,33 @@ class EchoOutput(BaseModel):
     )
 
 
+# Formatted local time for the current second, as [second, isoformat]
+_timestamp_cache = [0, ""]
+
+
+def _timestamp() -> str:
+    """
+    Get the current local time in ISO format.
+    
+    The date and time up to the second are formatted once per second;
+    only the microseconds are added per call.
+    
+    Returns:
+        The current time, formatted like datetime.now().isoformat().
+    """
+    now = time.time()
+    second = int(now)
+    
+    if second != _timestamp_cache[0]:
+        _timestamp_cache[1] = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache[0] = second
+    
+    microsecond = int((now - second) * 1_000_000)
+    if microsecond:
+        return f"{_timestamp_cache[1]}.{microsecond:06d}"
+    return _timestamp_cache[1]
+
+
 async def echo_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Echo tool that echoes back the input message.
@@ -48,7 +80,7 @@ async def echo_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
         The echoed message.
     """
     # Parse input
-    parsed_input = EchoInput(**input_data)
+    parsed_input = EchoInput.model_validate(input_data)
     
     # Get the message
     message = parsed_input.message
@@ -62,12 +94,10 @@ async def echo_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
         message = f"{parsed_input.prefix}: {message}"
     
     # Get timestamp
-    timestamp = datetime.now().isoformat()
-    
-    # Create output
-    output = EchoOutput(
-        message=message,
-        timestamp=timestamp,
-    )
+    timestamp = _timestamp()
     
-    return output.dict()
\ No newline at end of file
+    # Create output; the dict matches EchoOutput, so build it directly
+    return {
+        "message": message,
+        "timestamp": timestamp,
+    }
\ No newline at end of file
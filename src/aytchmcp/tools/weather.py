@@ -4,20 +4,27 @@ Weather Tool for AytchMCP.
 This tool provides weather information for a given location.
 """
 
-import json
+import asyncio
+import os
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 
-import httpx
 from fastmcp.tools import Tool
-from pydantic import BaseModel, Field
+from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field
 
+from aytchmcp._json import loads
 from aytchmcp.context import Context
-from aytchmcp.config import config
+from aytchmcp.http_client import get_async_client
 
 
 class WeatherInput(BaseModel):
     """Weather tool input model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     location: str = Field(
         description="The location to get weather for (city name, zip code, etc.)"
     )
@@ -34,6 +41,8 @@ class WeatherInput(BaseModel):
 class WeatherCondition(BaseModel):
     """Weather condition model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     main: str = Field(description="Main weather condition")
     description: str = Field(description="Weather condition description")
     icon: str = Field(description="Weather condition icon code")
@@ -42,6 +51,8 @@ class WeatherCondition(BaseModel):
 class WeatherTemperature(BaseModel):
     """Weather temperature model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     current: float = Field(description="Current temperature")
     feels_like: float = Field(description="Feels like temperature")
     min: float = Field(description="Minimum temperature")
@@ -51,6 +62,8 @@ class WeatherTemperature(BaseModel):
 class WeatherDay(BaseModel):
     """Weather day model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     date: str = Field(description="Date (YYYY-MM-DD)")
     temperature: WeatherTemperature = Field(description="Temperature information")
     conditions: List[WeatherCondition] = Field(description="Weather conditions")
@@ -65,6 +78,8 @@ class WeatherDay(BaseModel):
 class WeatherOutput(BaseModel):
     """Weather tool output model."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     location: str = Field(description="Location name")
     country: str = Field(description="Country code")
     units: str = Field(description="Temperature units (metric, imperial, standard)")
@@ -83,37 +98,40 @@ async def weather_tool(input_data: Dict[str, Any]) -> Dict[str, Any]:
         Weather information.
     """
     # Parse input
-    parsed_input = WeatherInput(**input_data)
+    parsed_input = WeatherInput.model_validate(input_data)
     
     # Get API key from environment
-    import os
     api_key = os.environ.get("OPENWEATHER_API_KEY")
     
     if not api_key:
         # Use mock data if no API key is available
-        return _get_mock_weather(parsed_input).dict()
+        return _get_mock_weather(parsed_input).model_dump()
     
     try:
-        # Get current weather
-        current_weather = await _get_current_weather(
-            parsed_input.location, parsed_input.units, api_key
-        )
-        
-        # Get forecast if requested
-        forecast = None
         if parsed_input.days and parsed_input.days > 1:
-            forecast = await _get_forecast(
-                parsed_input.location, parsed_input.units, parsed_input.days, api_key
+            # Get current weather and forecast concurrently
+            current_weather, forecast = await asyncio.gather(
+                _get_current_weather(
+                    parsed_input.location, parsed_input.units, api_key
+                ),
+                _get_forecast(
+                    parsed_input.location, parsed_input.units, parsed_input.days, api_key
+                ),
+            )
+            current_weather.forecast = forecast
+        else:
+            # Get current weather
+            current_weather = await _get_current_weather(
+                parsed_input.location, parsed_input.units, api_key
             )
         
-        return current_weather.dict()
+        return current_weather.model_dump()
     except Exception as e:
         # Log error
-        from loguru import logger
         logger.error(f"Error getting weather: {e}")
         
         # Fall back to mock data
-        return _get_mock_weather(parsed_input).dict()
+        return _get_mock_weather(parsed_input).model_dump()
 
 async def _get_current_weather(
     location: str, units: str, api_key: str
@@ -129,54 +147,51 @@ async def _get_current_weather(
     Returns:
         Current weather information.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.openweathermap.org/data/2.5/weather",
-            params={
-                "q": location,
-                "units": units,
-                "appid": api_key,
-            },
-        )
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Parse response
-        from datetime import datetime
-        
-        # Create current weather day
-        current = WeatherDay(
-            date=datetime.now().strftime("%Y-%m-%d"),
-            temperature=WeatherTemperature(
-                current=data["main"]["temp"],
-                feels_like=data["main"]["feels_like"],
-                min=data["main"]["temp_min"],
-                max=data["main"]["temp_max"],
-            ),
-            conditions=[
-                WeatherCondition(
-                    main=condition["main"],
-                    description=condition["description"],
-                    icon=condition["icon"],
-                )
-                for condition in data["weather"]
-            ],
-            humidity=data["main"]["humidity"],
-            wind_speed=data["wind"]["speed"],
-            wind_direction=data["wind"]["deg"],
-            pressure=data["main"]["pressure"],
-            sunrise=datetime.fromtimestamp(data["sys"]["sunrise"]).strftime("%H:%M"),
-            sunset=datetime.fromtimestamp(data["sys"]["sunset"]).strftime("%H:%M"),
-        )
-        
-        return WeatherOutput(
-            location=data["name"],
-            country=data["sys"]["country"],
-            units=units,
-            current=current,
-            forecast=None,
-        )
+    client = get_async_client()
+    response = await client.get(
+        "https://api.openweathermap.org/data/2.5/weather",
+        params={
+            "q": location,
+            "units": units,
+            "appid": api_key,
+        },
+    )
+    
+    response.raise_for_status()
+    data = loads(response.content)
+    
+    # Create current weather day
+    current = WeatherDay(
+        date=datetime.now().strftime("%Y-%m-%d"),
+        temperature=WeatherTemperature(
+            current=data["main"]["temp"],
+            feels_like=data["main"]["feels_like"],
+            min=data["main"]["temp_min"],
+            max=data["main"]["temp_max"],
+        ),
+        conditions=[
+            WeatherCondition(
+                main=condition["main"],
+                description=condition["description"],
+                icon=condition["icon"],
+            )
+            for condition in data["weather"]
+        ],
+        humidity=data["main"]["humidity"],
+        wind_speed=data["wind"]["speed"],
+        wind_direction=data["wind"]["deg"],
+        pressure=data["main"]["pressure"],
+        sunrise=datetime.fromtimestamp(data["sys"]["sunrise"]).strftime("%H:%M"),
+        sunset=datetime.fromtimestamp(data["sys"]["sunset"]).strftime("%H:%M"),
+    )
+    
+    return WeatherOutput(
+        location=data["name"],
+        country=data["sys"]["country"],
+        units=units,
+        current=current,
+        forecast=None,
+    )
 
 async def _get_forecast(
     location: str, units: str, days: int, api_key: str
@@ -193,96 +208,127 @@ async def _get_forecast(
     Returns:
         Weather forecast.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.openweathermap.org/data/2.5/forecast",
-            params={
-                "q": location,
-                "units": units,
-                "cnt": min(days * 8, 40),  # 8 forecasts per day, max 5 days
-                "appid": api_key,
-            },
-        )
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Parse response
-        from datetime import datetime
-        from collections import defaultdict
-        
-        # Group forecasts by day
-        forecasts_by_day = defaultdict(list)
-        for forecast in data["list"]:
-            date = datetime.fromtimestamp(forecast["dt"]).strftime("%Y-%m-%d")
-            forecasts_by_day[date].append(forecast)
-        
-        # Create forecast days
-        forecast_days = []
-        for date, forecasts in list(forecasts_by_day.items())[:days]:
-            # Get min/max temperatures
-            min_temp = min(forecast["main"]["temp_min"] for forecast in forecasts)
-            max_temp = max(forecast["main"]["temp_max"] for forecast in forecasts)
+    client = get_async_client()
+    response = await client.get(
+        "https://api.openweathermap.org/data/2.5/forecast",
+        params={
+            "q": location,
+            "units": units,
+            "cnt": min(days * 8, 40),  # 8 forecasts per day, max 5 days
+            "appid": api_key,
+        },
+    )
+    
+    response.raise_for_status()
+    data = loads(response.content)
+    
+    # Group forecasts by day; entries are in time order, so stop at the
+    # first entry past the requested number of days
+    forecasts_by_day = defaultdict(list)
+    for forecast in data["list"]:
+        day = datetime.fromtimestamp(forecast["dt"]).strftime("%Y-%m-%d")
+        if day not in forecasts_by_day and len(forecasts_by_day) == days:
+            break
+        forecasts_by_day[day].append(forecast)
+    
+    # Create forecast days
+    forecast_days = []
+    for day, forecasts in forecasts_by_day.items():
+        # Aggregate temperatures, conditions and averages in a single pass
+        min_temp = forecasts[0]["main"]["temp_min"]
+        max_temp = forecasts[0]["main"]["temp_max"]
+        condition_counts = Counter()
+        total_humidity = total_wind_speed = total_wind_direction = total_pressure = 0
+        for forecast in forecasts:
+            main = forecast["main"]
+            wind = forecast["wind"]
+            condition = forecast["weather"][0]
             
-            # Get most common condition
-            from collections import Counter
-            conditions = [forecast["weather"][0] for forecast in forecasts]
-            condition_counts = Counter(
-                (condition["main"], condition["description"], condition["icon"])
-                for condition in conditions
-            )
-            most_common_conditions = [
-                WeatherCondition(
-                    main=main,
-                    description=description,
-                    icon=icon,
-                )
-                for (main, description, icon), _ in condition_counts.most_common(3)
-            ]
+            if main["temp_min"] < min_temp:
+                min_temp = main["temp_min"]
+            if main["temp_max"] > max_temp:
+                max_temp = main["temp_max"]
             
-            # Get average values
-            avg_humidity = sum(forecast["main"]["humidity"] for forecast in forecasts) / len(forecasts)
-            avg_wind_speed = sum(forecast["wind"]["speed"] for forecast in forecasts) / len(forecasts)
-            avg_wind_direction = sum(forecast["wind"]["deg"] for forecast in forecasts) / len(forecasts)
-            avg_pressure = sum(forecast["main"]["pressure"] for forecast in forecasts) / len(forecasts)
+            condition_counts[(condition["main"], condition["description"], condition["icon"])] += 1
             
-            # Create forecast day
-            forecast_day = WeatherDay(
-                date=date,
-                temperature=WeatherTemperature(
-                    current=forecasts[0]["main"]["temp"],
-                    feels_like=forecasts[0]["main"]["feels_like"],
-                    min=min_temp,
-                    max=max_temp,
-                ),
-                conditions=most_common_conditions,
-                humidity=int(avg_humidity),
-                wind_speed=avg_wind_speed,
-                wind_direction=int(avg_wind_direction),
-                pressure=int(avg_pressure),
-                sunrise="N/A",  # Not available in forecast
-                sunset="N/A",  # Not available in forecast
+            total_humidity += main["humidity"]
+            total_wind_speed += wind["speed"]
+            total_wind_direction += wind["deg"]
+            total_pressure += main["pressure"]
+        
+        # Get most common condition
+        most_common_conditions = [
+            WeatherCondition(
+                main=condition_main,
+                description=description,
+                icon=icon,
             )
-            
-            forecast_days.append(forecast_day)
+            for (condition_main, description, icon), _ in condition_counts.most_common(3)
+        ]
+        
+        # Get average values
+        count = len(forecasts)
+        avg_humidity = total_humidity / count
+        avg_wind_speed = total_wind_speed / count
+        avg_wind_direction = total_wind_direction / count
+        avg_pressure = total_pressure / count
+        
+        # Create forecast day
+        forecast_day = WeatherDay(
+            date=day,
+            temperature=WeatherTemperature(
+                current=forecasts[0]["main"]["temp"],
+                feels_like=forecasts[0]["main"]["feels_like"],
+                min=min_temp,
+                max=max_temp,
+            ),
+            conditions=most_common_conditions,
+            humidity=int(avg_humidity),
+            wind_speed=avg_wind_speed,
+            wind_direction=int(avg_wind_direction),
+            pressure=int(avg_pressure),
+            sunrise="N/A",  # Not available in forecast
+            sunset="N/A",  # Not available in forecast
+        )
         
-        return forecast_days
+        forecast_days.append(forecast_day)
+    
+    return forecast_days
 
 def _get_mock_weather(input_data: WeatherInput) -> WeatherOutput:
     """
     Get mock weather data.
     
+    The returned model is cached and shared; do not modify it.
+    
     Args:
         input_data: The input data.
         
     Returns:
         Mock weather information.
     """
-    from datetime import datetime, timedelta
+    return _build_mock_weather(
+        input_data.location, input_data.units, input_data.days, datetime.now().date()
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_mock_weather(location: str, units: str, days: Optional[int], today: date) -> WeatherOutput:
+    """
+    Build mock weather data.
     
+    Args:
+        location: The location to get weather for.
+        units: The units to use for temperature.
+        days: Number of days to forecast.
+        today: The current date.
+        
+    Returns:
+        Mock weather information.
+    """
     # Create current weather day
     current = WeatherDay(
-        date=datetime.now().strftime("%Y-%m-%d"),
+        date=today.strftime("%Y-%m-%d"),
         temperature=WeatherTemperature(
             current=22.5,
             feels_like=23.0,
@@ -306,13 +352,13 @@ def _get_mock_weather(input_data: WeatherInput) -> WeatherOutput:
     
     # Create forecast if requested
     forecast = None
-    if input_data.days and input_data.days > 1:
+    if days and days > 1:
         forecast = []
-        for i in range(1, min(input_data.days, 7)):
-            date = (datetime.now() + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range(1, min(days, 7)):
+            forecast_date = (today + timedelta(days=i)).strftime("%Y-%m-%d")
             forecast.append(
                 WeatherDay(
-                    date=date,
+                    date=forecast_date,
                     temperature=WeatherTemperature(
                         current=22.0 + i,
                         feels_like=22.5 + i,
@@ -336,9 +382,9 @@ def _get_mock_weather(input_data: WeatherInput) -> WeatherOutput:
             )
     
     return WeatherOutput(
-        location=input_data.location,
+        location=location,
         country="US",
-        units=input_data.units,
+        units=units,
         current=current,
         forecast=forecast,
     )
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Tests for the calculator tool's expression whitelist."""
+
+import pytest
+
+from aytchmcp.tools.calculator import _compile, calculator_tool
+
+
+@pytest.mark.asyncio
+async def test_allowed_functions_and_constants():
+    result = await calculator_tool({"expression": "sqrt(16) * pi", "precision": 3})
+
+    assert result["error"] is None
+    assert result["formatted_result"] == "12.566"
+
+
+@pytest.mark.asyncio
+async def test_variables_are_available():
+    result = await calculator_tool({"expression": "x * 2.5", "variables": {"x": 2.0}})
+
+    assert result["error"] is None
+    assert result["formatted_result"] == "5"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expression, variables, error",
+    [
+        ("pi.real", None, "Attribute access is not allowed"),
+        ("sqrt(4).hex()", None, "Only calls to allowed functions are supported"),
+        ("abs(1)(2)", None, "Only calls to allowed functions are supported"),
+        ("open(1)", None, "Function 'open' is not allowed"),
+        ("__import__(1)", None, "Function '__import__' is not allowed"),
+        ("x(1)", {"x": 1.0}, "Function 'x' is not allowed"),
+    ],
+)
+async def test_rejected_expressions(expression, variables, error):
+    result = await calculator_tool({"expression": expression, "variables": variables})
+
+    assert result == {
+        "result": "Error",
+        "formatted_result": "Error",
+        "steps": None,
+        "error": error,
+    }
+
+
+def test_compiled_expressions_are_cached():
+    assert _compile("sqrt(2) + 1") is _compile("sqrt(2) + 1")
@@ -0,0 +1,95 @@
+"""Tests for the LLM response cache in aytchmcp.context."""
+
+import asyncio
+
+import pytest
+
+from aytchmcp import context
+from aytchmcp.config import MCPConfig
+from aytchmcp.context import Context
+
+
+async def _finish_refreshes():
+    """Wait for the background refreshes that are still running."""
+    await asyncio.gather(*list(context._llm_refreshing.values()))
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Route LLM calls to a fake provider and start from an empty cache."""
+    config = MCPConfig()
+    config.llm.provider = "fake"
+    config.llm._api_key = "test-key"
+    calls = []
+
+    async def fake_provider(self, prompt, model, api_key, temperature, max_tokens, params):
+        calls.append(prompt)
+        return f"response {len(calls)}"
+
+    monkeypatch.setattr(context, "get_config", lambda: config)
+    monkeypatch.setattr(Context, "_PROVIDERS", {"fake": fake_provider})
+    monkeypatch.setattr(context, "_llm_cache", type(context._llm_cache)())
+    monkeypatch.setattr(context, "_llm_refreshing", {})
+
+    return config, calls
+
+
+@pytest.mark.asyncio
+async def test_fresh_response_is_served_from_cache(llm):
+    _, calls = llm
+    ctx = Context()
+
+    assert await ctx.get_llm_response("hello", cache=True) == "response 1"
+    assert await ctx.get_llm_response("hello", cache=True) == "response 1"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_uncached_requests_always_call_the_provider(llm):
+    _, calls = llm
+    ctx = Context()
+
+    assert await ctx.get_llm_response("hello") == "response 1"
+    assert await ctx.get_llm_response("hello") == "response 2"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_response_is_refreshed_on_every_stale_hit(llm):
+    config, calls = llm
+    config.llm.cache_ttl = 0.0
+
+    # Refreshes that never suspend finish inside create_task() with eager tasks
+    loop = asyncio.get_running_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+
+    try:
+        ctx = Context()
+        assert await ctx.get_llm_response("hello", cache=True) == "response 1"
+
+        # The stale response is served while a refresh runs in the background
+        assert await ctx.get_llm_response("hello", cache=True) == "response 1"
+        await _finish_refreshes()
+        assert len(calls) == 2
+
+        # A second stale hit starts another refresh
+        assert await ctx.get_llm_response("hello", cache=True) == "response 2"
+        await _finish_refreshes()
+        assert len(calls) == 3
+        assert not context._llm_refreshing
+    finally:
+        loop.set_task_factory(None)
+
+
+@pytest.mark.asyncio
+async def test_expired_response_is_fetched_again(llm):
+    config, calls = llm
+    config.llm.cache_ttl = 0.0
+    config.llm.cache_max_stale = 0.0
+    ctx = Context()
+
+    assert await ctx.get_llm_response("hello", cache=True) == "response 1"
+    assert await ctx.get_llm_response("hello", cache=True) == "response 2"
+    assert not context._llm_refreshing